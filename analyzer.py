@@ -6,12 +6,20 @@ Fetches real Solana on-chain data via RPC, counts transactions, estimates activi
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 from rpc_client import TxSignatureInfo, get_recent_transactions
+from subscriber import get_cached_signatures, track_wallet
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python path below
+    np = None  # type: ignore[assignment]
 
 # Activity: tx count -> 0–100 score (log-like scale; 100+ txs = 100)
 TX_COUNT_FOR_FULL_ACTIVITY = 100
@@ -21,6 +29,8 @@ ACTIVITY_LEVEL_HIGH_THRESHOLD = 70.0
 # Wallet age: months since oldest tx; no txs -> deterministic mock
 SECONDS_PER_MONTH = 30 * 24 * 3600
 MOCK_AGE_CAP_MONTHS = 24
+# Below this many txs the Python min() beats the NumPy array round-trip
+NUMPY_MIN_BATCH = 256
 
 # Mock suspicious behavior flag identifiers (explainable; replace with real rules later)
 RISK_NEW_WALLET = "new_wallet"
@@ -40,7 +50,8 @@ class WalletMetrics:
     activity_score: float
     activity_level: ActivityLevel
     suspicious_behavior_count: int
-    risk_flags: tuple[str, ...]
+    # Immutable by convention; kept a list so the API model reuses it copy-free
+    risk_flags: list[str]
 
 
 def _tx_count_to_activity_score(tx_count: int) -> float:
@@ -64,29 +75,37 @@ def _activity_score_to_level(score: float) -> ActivityLevel:
 
 
 def _oldest_block_time(infos: list[TxSignatureInfo]) -> int | None:
-    """Return oldest block_time from list; ignore None."""
+    """
+    Return oldest block_time from list; ignore None.
+    Large lists (limit raised for analytics) take a vectorized NumPy min.
+    """
+    if np is not None and len(infos) >= NUMPY_MIN_BATCH:
+        times_arr = np.fromiter(
+            (i.block_time for i in infos if i.block_time is not None),
+            dtype=np.int64,
+        )
+        return int(times_arr.min()) if times_arr.size else None
     times = [i.block_time for i in infos if i.block_time is not None]
     return min(times) if times else None
 
 
 def _wallet_age_months(oldest_ts: int | None) -> int:
-    """Compute wallet age in months from oldest tx timestamp."""
+    """Compute wallet age in months from oldest tx timestamp (pure int math)."""
     if oldest_ts is None:
         return 0
-    now = int(time.time())
-    if now <= oldest_ts:
-        return 0
-    months = (now - oldest_ts) / SECONDS_PER_MONTH
-    return max(0, int(months))
+    now = time.time_ns() // 1_000_000_000
+    return max(0, (now - oldest_ts) // SECONDS_PER_MONTH)
 
 
+@lru_cache(maxsize=4096)
 def _mock_wallet_age_months(wallet: str) -> int:
     """
     Deterministic mock wallet age in months when no on-chain history exists.
     Same wallet address always yields the same value (0..MOCK_AGE_CAP_MONTHS).
+    Memoized for hot wallets; BLAKE2b is plenty for a non-crypto bucket.
     """
-    h = hashlib.sha256(wallet.strip().encode("utf-8")).hexdigest()
-    return int(h[:8], 16) % (MOCK_AGE_CAP_MONTHS + 1)
+    h = hashlib.blake2b(wallet.strip().encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(h, "big") % (MOCK_AGE_CAP_MONTHS + 1)
 
 
 def _compute_risk_flags(
@@ -108,13 +127,37 @@ def _compute_risk_flags(
     return flags
 
 
-def analyze_wallet(wallet: str) -> WalletMetrics:
+# Single-flight: concurrent requests for the same wallet share one RPC fetch.
+# Maps wallet -> task resolving to that wallet's metrics (or its error).
+_inflight: dict[str, asyncio.Task[WalletMetrics]] = {}
+
+
+async def analyze_wallet(wallet: str) -> WalletMetrics:
     """
     Analyze wallet: fetch recent txs from Solana RPC, compute explainable metrics.
+    Concurrent calls for the same wallet are coalesced into a single RPC fetch;
+    the fetch runs as its own task so one cancelled caller cannot fail the rest.
     Wallet age: from oldest tx when available; deterministic mock (by address) when none.
     """
     wallet = wallet.strip()
-    txs = get_recent_transactions(wallet)
+    task = _inflight.get(wallet)
+    if task is None:
+        task = asyncio.create_task(_analyze_wallet(wallet))
+        _inflight[wallet] = task
+        task.add_done_callback(lambda _: _inflight.pop(wallet, None))
+    return await asyncio.shield(task)
+
+
+async def _analyze_wallet(wallet: str) -> WalletMetrics:
+    """
+    Uncoalesced analysis: metric computation over the wallet's signatures,
+    read from the streaming window when the wallet is tracked, otherwise
+    fetched via RPC (which starts tracking it).
+    """
+    txs = get_cached_signatures(wallet)
+    if txs is None:
+        txs = await get_recent_transactions(wallet)
+        track_wallet(wallet, txs)
     tx_count = len(txs)
     oldest_ts = _oldest_block_time(txs)
     wallet_age_months = (
@@ -133,5 +176,5 @@ def analyze_wallet(wallet: str) -> WalletMetrics:
         activity_score=activity_score,
         activity_level=activity_level,
         suspicious_behavior_count=suspicious_behavior_count,
-        risk_flags=tuple(risk_flags),
+        risk_flags=risk_flags,
     )
@@ -0,0 +1,102 @@
+"""
+Short-TTL result cache for trust scores, keyed by wallet address.
+Uses Redis (redis.asyncio) when available; falls back to a small in-process
+TTL dict so the API works without a Redis deployment. Cache failures are
+never fatal — the caller just recomputes.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Optional
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis is optional; fall back to in-process cache
+    aioredis = None  # type: ignore[assignment]
+
+# Cache key namespace; bump the version when the response schema changes
+CACHE_KEY_PREFIX = "ts:v2"
+# TTL for cached trust scores in seconds (keep within 60-600s in production;
+# TRUST_SCORE_CACHE_TTL overrides, e.g. shorter when streaming keeps data fresh)
+DEFAULT_TTL_SECONDS = int(os.environ.get("TRUST_SCORE_CACHE_TTL", "300"))
+
+_redis_client: Optional["aioredis.Redis"] = None
+
+# In-process fallback: key -> (expires_at_monotonic, payload)
+_local_cache: dict[str, tuple[float, str]] = {}
+_LOCAL_CACHE_MAX_ENTRIES = 4096
+
+
+def cache_key(wallet: str) -> str:
+    """Build the cache key for a wallet's trust score result."""
+    return f"{CACHE_KEY_PREFIX}:{wallet}"
+
+
+def _get_redis() -> Optional["aioredis.Redis"]:
+    """Lazily create the shared Redis client from REDIS_URL; None if unavailable."""
+    global _redis_client
+    if aioredis is None:
+        return None
+    url = os.environ.get("REDIS_URL")
+    if not url:
+        return None
+    if _redis_client is None:
+        # Short socket timeouts: a down Redis must not stall the request path
+        _redis_client = aioredis.from_url(
+            url,
+            decode_responses=True,
+            socket_connect_timeout=1.0,
+            socket_timeout=1.0,
+        )
+    return _redis_client
+
+
+async def get_cached(key: str) -> str | None:
+    """Return the cached JSON payload for key, or None on miss/any cache error."""
+    client = _get_redis()
+    if client is not None:
+        try:
+            return await client.get(key)
+        except Exception:
+            return None
+    entry = _local_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, payload = entry
+    if time.monotonic() >= expires_at:
+        _local_cache.pop(key, None)
+        return None
+    return payload
+
+
+async def set_cached(key: str, payload: str, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+    """Store a JSON payload under key with a TTL; errors are swallowed."""
+    client = _get_redis()
+    if client is not None:
+        try:
+            await client.set(key, payload, ex=ttl)
+        except Exception:
+            pass
+        return
+    if len(_local_cache) >= _LOCAL_CACHE_MAX_ENTRIES:
+        # Drop expired entries first; if still full, clear (cache is best-effort)
+        now = time.monotonic()
+        for k in [k for k, (exp, _) in _local_cache.items() if exp <= now]:
+            _local_cache.pop(k, None)
+        if len(_local_cache) >= _LOCAL_CACHE_MAX_ENTRIES:
+            _local_cache.clear()
+    _local_cache[key] = (time.monotonic() + ttl, payload)
+
+
+async def close_cache() -> None:
+    """Close the Redis connection on app shutdown (no-op for the local fallback)."""
+    global _redis_client
+    if _redis_client is not None:
+        try:
+            await _redis_client.aclose()
+        except Exception:
+            pass
+        _redis_client = None
+    _local_cache.clear()
@@ -1,15 +1,20 @@
 """
 SQLite database layer for trust score history.
 Stores result (trust_score, risk_level) and metrics (tx_count, wallet_age_months, etc.).
+One persistent WAL-mode connection serves the whole process; writes are
+serialized with a lock instead of re-opening the file per insert.
+Inserts go through a background writer queue that batches rows into a
+single commit, keeping the fsync off the request critical path.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
 import sqlite3
-from contextlib import contextmanager
+import threading
 from pathlib import Path
-from typing import Generator
+from typing import Any, Optional
 
 # Database file lives next to this module inside app/ai-engine/
 DATABASE_PATH = Path(__file__).resolve().parent / "trust.db"
@@ -21,13 +26,36 @@ METRICS_COLUMNS = [
     ("tx_count", "INTEGER"),
     ("wallet_age_months", "INTEGER"),
     ("activity_score", "REAL"),
-    ("risk_flags", "TEXT"),  # JSON array
+    # Bitmask of scoring_numba.FLAG_* bits; replaces the legacy risk_flags
+    # JSON TEXT column (left in place in old DBs) - 10x smaller and SARGable
+    ("risk_flags_mask", "INTEGER"),
 ]
 
 
+# Persistent connection (created by init_db / first use); guarded by _LOCK for
+# writes since FastAPI may call from to_thread worker threads
+_CONN: sqlite3.Connection | None = None
+_LOCK = threading.Lock()
+
+INSERT_SQL = f"""
+    INSERT INTO {TABLE_NAME} (
+        wallet, trust_score, risk_level, timestamp,
+        tx_count, wallet_age_months, activity_score, risk_flags_mask
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Background writer: rows queue up here and are flushed in batches so one
+# commit/fsync covers many inserts. Started from lifespan.
+WRITE_BATCH_MAX_ROWS = 100
+_QUEUE: Optional[asyncio.Queue[Optional[tuple[Any, ...]]]] = None
+_WRITER_TASK: Optional[asyncio.Task[None]] = None
+
+
 def init_db() -> None:
     """Create the trust_history table if it does not exist; add metrics columns if missing."""
-    with _connection() as conn:
+    with _LOCK:
+        conn = _get_connection()
         conn.execute(
             f"""
             CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
@@ -39,12 +67,21 @@ def init_db() -> None:
                 tx_count INTEGER,
                 wallet_age_months INTEGER,
                 activity_score REAL,
-                risk_flags TEXT
+                risk_flags_mask INTEGER
             )
             """
         )
         conn.commit()
         _add_columns_if_missing(conn)
+        # Index for per-wallet lookups (e.g. latest score for wallet X):
+        # B-tree seek instead of a full history scan
+        conn.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_trust_wallet
+            ON {TABLE_NAME} (wallet, timestamp DESC)
+            """
+        )
+        conn.commit()
 
 
 def _add_columns_if_missing(conn: sqlite3.Connection) -> None:
@@ -59,15 +96,80 @@ def _add_columns_if_missing(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
-@contextmanager
-def _connection() -> Generator[sqlite3.Connection, None, None]:
-    """Yield a database connection, closing it on exit."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
-        conn.close()
+def _get_connection() -> sqlite3.Connection:
+    """Return the persistent connection, creating and configuring it on first use."""
+    global _CONN
+    if _CONN is None:
+        # cached_statements keeps the prepared INSERT around between calls,
+        # skipping the SQL re-parse per write
+        conn = sqlite3.connect(
+            DATABASE_PATH, check_same_thread=False, cached_statements=128
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers proceed alongside the writer; NORMAL skips the
+        # per-commit fsync of FULL while staying crash-safe in WAL mode
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        _CONN = conn
+    return _CONN
+
+
+def close_db() -> None:
+    """Close the persistent connection on app shutdown."""
+    global _CONN
+    with _LOCK:
+        if _CONN is not None:
+            _CONN.close()
+            _CONN = None
+
+
+def _write_rows(rows: list[tuple[Any, ...]]) -> None:
+    """Insert a batch of rows in one transaction (one commit/fsync for all)."""
+    with _LOCK:
+        conn = _get_connection()
+        conn.executemany(INSERT_SQL, rows)
+        conn.commit()
+
+
+async def _writer_loop(queue: asyncio.Queue[Optional[tuple[Any, ...]]]) -> None:
+    """Drain the queue forever, flushing batches; a None row signals shutdown."""
+    stopping = False
+    while not stopping:
+        rows = [await queue.get()]
+        while len(rows) < WRITE_BATCH_MAX_ROWS:
+            try:
+                rows.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if None in rows:  # shutdown sentinel (late rows may drain in after it)
+            stopping = True
+            rows = [r for r in rows if r is not None]
+        if rows:
+            try:
+                await asyncio.to_thread(_write_rows, rows)
+            except Exception:
+                # History is best-effort: a failed flush (e.g. transient lock)
+                # must not kill the writer and orphan the queue
+                logging.getLogger(__name__).exception("trust_history batch insert failed")
+
+
+async def start_writer() -> None:
+    """Start the background writer task (call from lifespan startup)."""
+    global _QUEUE, _WRITER_TASK
+    if _WRITER_TASK is None:
+        _QUEUE = asyncio.Queue()
+        _WRITER_TASK = asyncio.create_task(_writer_loop(_QUEUE))
+
+
+async def stop_writer() -> None:
+    """Flush pending rows and stop the writer (call from lifespan shutdown)."""
+    global _QUEUE, _WRITER_TASK
+    if _WRITER_TASK is not None and _QUEUE is not None:
+        _QUEUE.put_nowait(None)
+        await _WRITER_TASK
+        _WRITER_TASK = None
+        _QUEUE = None
 
 
 def insert_trust_record(
@@ -77,35 +179,28 @@ def insert_trust_record(
     tx_count: int | None = None,
     wallet_age_months: int | None = None,
     activity_score: float | None = None,
-    risk_flags: list[str] | None = None,
+    risk_flags_mask: int | None = None,
 ) -> None:
     """
-    Persist a single trust score result and its metrics.
+    Persist a single trust score result and its metrics. risk_flags_mask packs
+    scoring_numba.FLAG_* bits (decode with scoring_numba.flags_from_mask).
+    Enqueues for the background writer when it is running (non-blocking);
+    writes synchronously otherwise (scripts, tests).
     """
     from datetime import datetime, timezone
 
     timestamp = datetime.now(timezone.utc).isoformat()
-    risk_flags_json: str | None = (
-        json.dumps(risk_flags) if risk_flags is not None else None
+    row = (
+        wallet,
+        trust_score,
+        risk_level,
+        timestamp,
+        tx_count,
+        wallet_age_months,
+        activity_score,
+        risk_flags_mask,
     )
-    with _connection() as conn:
-        conn.execute(
-            f"""
-            INSERT INTO {TABLE_NAME} (
-                wallet, trust_score, risk_level, timestamp,
-                tx_count, wallet_age_months, activity_score, risk_flags
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                wallet,
-                trust_score,
-                risk_level,
-                timestamp,
-                tx_count,
-                wallet_age_months,
-                activity_score,
-                risk_flags_json,
-            ),
-        )
-        conn.commit()
+    if _QUEUE is not None:
+        _QUEUE.put_nowait(row)
+    else:
+        _write_rows([row])
@@ -7,13 +7,21 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
 from analyzer import analyze_wallet
-from db import init_db, insert_trust_record
+from cache import cache_key, close_cache, get_cached, set_cached
+from db import close_db, init_db, insert_trust_record, start_writer, stop_writer
 from models import TrustMetrics, TrustScoreRequest, TrustScoreResponse
+from rpc_client import close_client, get_client, is_valid_base58_address
 from scoring import compute_trust_score
+from scoring_numba import mask_from_flags
+from scoring_numba import warmup as warmup_batch_scoring
+from subscriber import start_subscriber, stop_subscriber
 
 # ---------------------------------------------------------------------------
 # App lifecycle
@@ -22,9 +30,18 @@ from scoring import compute_trust_score
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Startup: ensure DB and table exist. Shutdown: optional teardown."""
+    """Startup: ensure DB and table exist, warm the RPC client. Shutdown: close clients."""
     init_db()
+    get_client()
+    warmup_batch_scoring()
+    await start_writer()
+    await start_subscriber()
     yield
+    await stop_subscriber()
+    await stop_writer()
+    await close_client()
+    await close_cache()
+    close_db()
 
 
 # ---------------------------------------------------------------------------
@@ -36,6 +53,8 @@ app = FastAPI(
     description="Web3 trust infrastructure: explainable trust scores for wallet addresses",
     version="2.0.0",
     lifespan=lifespan,
+    # orjson emits bytes directly, 2-5x faster than stdlib json serialization
+    default_response_class=ORJSONResponse,
 )
 
 # Allow frontend from any origin
@@ -54,20 +73,39 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.post("/trust-score", response_model=TrustScoreResponse)
-async def trust_score(body: TrustScoreRequest) -> TrustScoreResponse:
+# Serializer built once: dump_json goes straight to bytes and, by returning a
+# Response, skips FastAPI's second validation pass over the response model
+_RESPONSE_ADAPTER: TypeAdapter[TrustScoreResponse] = TypeAdapter(TrustScoreResponse)
+
+
+# Cache headers for the GET variant: edge/CDN absorbs repeat lookups for the
+# same TTL window the Redis layer uses
+CACHE_CONTROL_HEADER = "public, max-age=300, stale-while-revalidate=60"
+
+
+async def _trust_score_payload(wallet: str) -> str:
     """
-    POST /trust-score (backward compatible). Accepts { wallet: string }.
-    Fetches on-chain data via Solana RPC, analyzes metrics, computes trust_score (0–100),
-    determines risk_level (Low / Medium / High), saves result + metrics to SQLite,
-    returns JSON: trust_score, risk_level, metrics.
+    Validate the wallet and return the serialized TrustScoreResponse JSON,
+    from cache when fresh, otherwise computed (and cached). Raises
+    HTTPException for invalid input or RPC failure.
     """
-    wallet = body.wallet.strip()
     if not wallet:
         raise HTTPException(status_code=400, detail="wallet must be non-empty")
+    if not is_valid_base58_address(wallet):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid Solana address: expected 32-44 base58 characters",
+        )
+
+    # Short-TTL cache: duplicate queries for the same wallet skip the RPC round-trip
+    key = cache_key(wallet)
+    cached = await get_cached(key)
+    if cached is not None:
+        # Cached payload is exactly the bytes we serialized below: serve as-is
+        return cached
 
     try:
-        metrics = analyze_wallet(wallet)
+        metrics = await analyze_wallet(wallet)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
@@ -77,6 +115,7 @@ async def trust_score(body: TrustScoreRequest) -> TrustScoreResponse:
         ) from e
 
     score, risk_level = compute_trust_score(metrics)
+    # Non-blocking: enqueues for the background writer started in lifespan
     insert_trust_record(
         wallet=wallet,
         trust_score=score,
@@ -84,7 +123,7 @@ async def trust_score(body: TrustScoreRequest) -> TrustScoreResponse:
         tx_count=metrics.tx_count,
         wallet_age_months=metrics.wallet_age_months,
         activity_score=metrics.activity_score,
-        risk_flags=list(metrics.risk_flags),
+        risk_flags_mask=mask_from_flags(metrics.risk_flags),
     )
 
     api_metrics = TrustMetrics(
@@ -93,12 +132,43 @@ async def trust_score(body: TrustScoreRequest) -> TrustScoreResponse:
         activity_score=metrics.activity_score,
         activity_level=metrics.activity_level,
         suspicious_behavior_count=metrics.suspicious_behavior_count,
-        risk_flags=list(metrics.risk_flags),
+        risk_flags=metrics.risk_flags,
     )
 
-    return TrustScoreResponse(
+    response = TrustScoreResponse(
         wallet=wallet,
         trust_score=score,
         risk_level=risk_level,
         metrics=api_metrics,
     )
+    payload = _RESPONSE_ADAPTER.dump_json(response).decode()
+    await set_cached(key, payload)
+    return payload
+
+
+@app.post("/trust-score", response_model=TrustScoreResponse)
+async def trust_score(body: TrustScoreRequest) -> Response:
+    """
+    POST /trust-score (backward compatible). Accepts { wallet: string }.
+    Fetches on-chain data via Solana RPC, analyzes metrics, computes trust_score (0–100),
+    determines risk_level (Low / Medium / High), saves result + metrics to SQLite,
+    returns JSON: trust_score, risk_level, metrics.
+    """
+    payload = await _trust_score_payload(body.wallet.strip())
+    return Response(content=payload, media_type="application/json")
+
+
+@app.get("/trust-score/{wallet}", response_model=TrustScoreResponse)
+async def trust_score_get(wallet: str, request: Request) -> Response:
+    """
+    GET variant of /trust-score, cacheable at the HTTP layer: responds with
+    Cache-Control and a weak ETag derived from the score, and answers
+    If-None-Match with 304 so browsers/CDNs can absorb repeat lookups.
+    """
+    payload = await _trust_score_payload(wallet.strip())
+    doc = orjson.loads(payload)
+    etag = f'W/"{doc["trust_score"]}-{doc["risk_level"]}"'
+    headers = {"Cache-Control": CACHE_CONTROL_HEADER, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
@@ -13,14 +13,18 @@ ActivityLevel = Literal["low", "medium", "high"]
 
 
 class TrustScoreRequest(BaseModel):
-    """Request body for POST /trust-score. Accepts { wallet: string }."""
+    """Request body for POST /trust-score. Accepts { wallet: string }.
+    Emptiness/shape are checked in the handler (after strip), so the field
+    carries no per-request constraint evaluation."""
 
-    wallet: str = Field(..., min_length=1, description="Solana wallet address to score")
+    wallet: str = Field(..., description="Solana wallet address to score")
 
 
 class TrustMetrics(BaseModel):
     """Structured metrics from on-chain analysis used to compute the trust score."""
 
+    model_config = {"frozen": True}
+
     tx_count: int = Field(
         ...,
         ge=0,
@@ -55,6 +59,8 @@ class TrustMetrics(BaseModel):
 class TrustScoreResponse(BaseModel):
     """Response body for POST /trust-score. Backward compatible: trust_score + risk_level + metrics."""
 
+    model_config = {"frozen": True}
+
     wallet: str
     trust_score: int = Field(..., ge=0, le=100, description="Trust score 0–100")
     risk_level: RiskLevel
@@ -1,23 +1,39 @@
 """
 Solana RPC client for fetching on-chain wallet data.
 Uses solana-py to connect to Solana mainnet RPC and fetch recent transactions.
+Async: the RPC round-trip awaits on the event loop instead of blocking a worker.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+import re
+import time
 from dataclasses import dataclass
 from typing import Optional
 
-from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
 from solders.pubkey import Pubkey
 
 # Solana mainnet RPC (override with SOLANA_RPC_URL env for private RPC)
 DEFAULT_RPC_URL = "https://api.mainnet-beta.solana.com"
+# Base58 alphabet (no 0, O, I, l); Solana addresses encode to 32-44 chars
+_B58_ADDRESS_RE = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,44}$")
 MAX_SIGNATURES_LIMIT = 100
 # Request timeout in seconds (solana-py Client uses this when supported)
 DEFAULT_TIMEOUT = 30
 
+# Throttle + circuit breaker around the public endpoint: bursts otherwise hit
+# its 429 limits, and once it degrades every call burns the full timeout
+RPC_MAX_CALLS_PER_SECOND = 10
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failures before the circuit opens
+CIRCUIT_OPEN_SECONDS = 30.0  # fail-fast window before the next attempt
+
+
+class RpcCircuitOpenError(Exception):
+    """Raised without touching the network while the RPC circuit is open."""
+
 
 @dataclass(frozen=True)
 class TxSignatureInfo:
@@ -32,26 +48,109 @@ def get_rpc_url() -> str:
     return os.environ.get("SOLANA_RPC_URL", DEFAULT_RPC_URL)
 
 
-def get_recent_transactions(
+def is_valid_base58_address(address: str) -> bool:
+    """
+    Cheap shape check for a Solana address: base58 alphabet, plausible length.
+    Rejects malformed input before the cache/RPC path; full decoding still
+    happens in Pubkey.from_string right before the RPC call.
+    """
+    return _B58_ADDRESS_RE.fullmatch(address) is not None
+
+
+# Token bucket state (RPC_MAX_CALLS_PER_SECOND refill) and circuit state
+_bucket_tokens: float = RPC_MAX_CALLS_PER_SECOND
+_bucket_refill_ts: float = 0.0
+_bucket_lock: Optional[asyncio.Lock] = None
+_consecutive_failures: int = 0
+_circuit_open_until: float = 0.0
+
+
+async def _acquire_rpc_slot() -> None:
+    """Take a token from the rate bucket, sleeping until one refills."""
+    global _bucket_tokens, _bucket_refill_ts, _bucket_lock
+    if _bucket_lock is None:
+        _bucket_lock = asyncio.Lock()
+    async with _bucket_lock:
+        now = time.monotonic()
+        _bucket_tokens = min(
+            float(RPC_MAX_CALLS_PER_SECOND),
+            _bucket_tokens + (now - _bucket_refill_ts) * RPC_MAX_CALLS_PER_SECOND,
+        )
+        _bucket_refill_ts = now
+        if _bucket_tokens < 1.0:
+            await asyncio.sleep((1.0 - _bucket_tokens) / RPC_MAX_CALLS_PER_SECOND)
+            _bucket_tokens = 1.0
+            _bucket_refill_ts = time.monotonic()
+        _bucket_tokens -= 1.0
+
+
+def _record_rpc_result(success: bool) -> None:
+    """Track consecutive failures; open the circuit at the threshold."""
+    global _consecutive_failures, _circuit_open_until
+    if success:
+        _consecutive_failures = 0
+        return
+    _consecutive_failures += 1
+    if _consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+        _circuit_open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+        _consecutive_failures = 0
+
+
+# Shared client: one connection pool for the process, so repeat requests reuse
+# the TLS session / keep-alive connection instead of re-handshaking per call
+_CLIENT: Optional[AsyncClient] = None
+
+
+def get_client() -> AsyncClient:
+    """Return the shared AsyncClient, creating it on first use. Call from
+    lifespan at startup to warm the connection before the first request."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = AsyncClient(get_rpc_url(), timeout=DEFAULT_TIMEOUT)
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared client on app shutdown."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.close()
+        _CLIENT = None
+
+
+async def get_recent_transactions(
     wallet_address: str,
     limit: int = MAX_SIGNATURES_LIMIT,
     rpc_url: Optional[str] = None,
 ) -> list[TxSignatureInfo]:
     """
     Fetch recent transaction signatures for a Solana wallet from mainnet RPC.
-    Uses solana-py Client; requires valid base58 Solana address.
+    Uses solana-py AsyncClient so the event loop stays free during the
+    round-trip; requires valid base58 Solana address.
     Returns list of (signature, block_time); block_time may be None.
-    Raises ValueError for invalid address; propagates RPC/network errors.
+    Raises ValueError for invalid address, RpcCircuitOpenError while the
+    circuit is open; propagates RPC/network errors.
+    Uses the shared client unless an explicit rpc_url overrides it.
     """
-    url = rpc_url or get_rpc_url()
-    client = Client(url, timeout=DEFAULT_TIMEOUT)
-
     try:
         pubkey = Pubkey.from_string(wallet_address.strip())
     except Exception as e:
         raise ValueError(f"Invalid Solana address: {e}") from e
 
-    response = client.get_signatures_for_address(pubkey, limit=limit)
+    if time.monotonic() < _circuit_open_until:
+        raise RpcCircuitOpenError("Solana RPC circuit open; failing fast")
+    await _acquire_rpc_slot()
+    try:
+        if rpc_url is not None:
+            async with AsyncClient(rpc_url, timeout=DEFAULT_TIMEOUT) as client:
+                response = await client.get_signatures_for_address(pubkey, limit=limit)
+        else:
+            client = get_client()
+            response = await client.get_signatures_for_address(pubkey, limit=limit)
+    except Exception:
+        _record_rpc_result(success=False)
+        raise
+    _record_rpc_result(success=True)
     if response.value is None:
         return []
 
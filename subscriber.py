@@ -0,0 +1,183 @@
+"""
+Push-based signature streaming for hot wallets.
+Keeps a logsSubscribe WebSocket open to the Solana RPC node and maintains a
+rolling in-memory window of recent signatures per tracked wallet, so repeat
+lookups read memory instead of re-polling getSignaturesForAddress. Wallets are
+tracked on their first RPC fetch (which seeds the window); notifications keep
+it fresh. A window is only served while its logsSubscribe is confirmed on the
+current connection - on disconnect all windows are dropped, so with the
+WebSocket endpoint unreachable the analyzer's RPC path works exactly as
+before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Optional
+
+import orjson
+
+from rpc_client import TxSignatureInfo, get_rpc_url
+
+try:
+    import websockets
+except ImportError:  # websockets ships with solana-py; guard anyway
+    websockets = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Rolling signatures kept per tracked wallet (matches the RPC fetch limit)
+SIGNATURE_WINDOW = 100
+# Cap on tracked wallets: bounds memory and stays under RPC subscription
+# limits; wallets beyond the cap simply keep using the RPC path
+MAX_TRACKED_WALLETS = 512
+# Seconds between reconnect attempts after a dropped/failed connection
+RECONNECT_DELAY = 5.0
+
+# wallet -> newest-first window of recent signatures
+_windows: dict[str, Deque[TxSignatureInfo]] = {}
+# wallets whose logsSubscribe was acked on the current connection; only these
+# windows are served (a window without a live subscription would freeze)
+_live: set[str] = set()
+# wallets waiting for a logsSubscribe to be sent
+_pending: Optional[asyncio.Queue[str]] = None
+_TASK: Optional[asyncio.Task[None]] = None
+
+
+def get_ws_url() -> str:
+    """Derive the WebSocket endpoint from the configured RPC URL."""
+    url = get_rpc_url()
+    if url.startswith("https://"):
+        return "wss://" + url[len("https://"):]
+    if url.startswith("http://"):
+        return "ws://" + url[len("http://"):]
+    return url
+
+
+def get_cached_signatures(wallet: str) -> list[TxSignatureInfo] | None:
+    """Return the wallet's streamed window, or None unless its subscription is live."""
+    if wallet not in _live:
+        return None
+    window = _windows.get(wallet)
+    return list(window) if window is not None else None
+
+
+def track_wallet(wallet: str, infos: list[TxSignatureInfo]) -> None:
+    """
+    Start streaming a wallet: seed its window from an RPC fetch (newest first)
+    and queue the logsSubscribe. No-op when the subscriber is not running.
+    """
+    if _pending is None or wallet in _windows or len(_windows) >= MAX_TRACKED_WALLETS:
+        return
+    _windows[wallet] = deque(infos[:SIGNATURE_WINDOW], maxlen=SIGNATURE_WINDOW)
+    _pending.put_nowait(wallet)
+
+
+def _subscribe_msg(request_id: int, wallet: str) -> bytes:
+    """Build a logsSubscribe JSON-RPC message mentioning the wallet."""
+    return orjson.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "logsSubscribe",
+            "params": [{"mentions": [wallet]}, {"commitment": "confirmed"}],
+        }
+    )
+
+
+async def _sender(ws, id_to_wallet: dict[int, str], start_id: int) -> None:
+    """Forward queued track_wallet requests to the socket as logsSubscribe."""
+    assert _pending is not None
+    request_id = start_id
+    while True:
+        wallet = await _pending.get()
+        id_to_wallet[request_id] = wallet
+        await ws.send(_subscribe_msg(request_id, wallet))
+        request_id += 1
+
+
+async def _subscriber_loop() -> None:
+    """Hold the connection; wallets re-track via the RPC path after a drop."""
+    while True:
+        sender_task: Optional[asyncio.Task[None]] = None
+        try:
+            async with websockets.connect(get_ws_url()) as ws:
+                id_to_wallet: dict[int, str] = {}
+                sub_to_wallet: dict[int, str] = {}
+                sender_task = asyncio.create_task(
+                    _sender(ws, id_to_wallet, start_id=1)
+                )
+                async for raw in ws:
+                    msg = orjson.loads(raw)
+                    if msg.get("method") == "logsNotification":
+                        params = msg["params"]
+                        wallet = sub_to_wallet.get(params["subscription"])
+                        window = _windows.get(wallet) if wallet else None
+                        if window is not None:
+                            # Notifications are real-time: stamp with now
+                            window.appendleft(
+                                TxSignatureInfo(
+                                    signature=params["result"]["value"]["signature"],
+                                    block_time=int(time.time()),
+                                )
+                            )
+                    elif "error" in msg:  # logsSubscribe rejected (unsupported/quota)
+                        wallet = id_to_wallet.pop(msg.get("id"), None)
+                        if wallet is not None:
+                            # Untrack so the wallet returns to the RPC path
+                            # instead of keeping a window nothing updates
+                            _live.discard(wallet)
+                            _windows.pop(wallet, None)
+                            logger.warning(
+                                "logsSubscribe rejected for %s: %s",
+                                wallet,
+                                msg["error"],
+                            )
+                    elif "result" in msg:  # logsSubscribe ack: window goes live
+                        wallet = id_to_wallet.pop(msg.get("id"), None)
+                        if wallet is not None:
+                            sub_to_wallet[msg["result"]] = wallet
+                            _live.add(wallet)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("signature subscriber disconnected (%s); retrying", e)
+        finally:
+            if sender_task is not None:
+                sender_task.cancel()
+            # The connection (and every subscription on it) is gone: frozen
+            # windows must not be served, so drop all streaming state and let
+            # wallets re-track through their next RPC fetch
+            _live.clear()
+            _windows.clear()
+            if _pending is not None:
+                while not _pending.empty():
+                    _pending.get_nowait()
+        await asyncio.sleep(RECONNECT_DELAY)
+
+
+async def start_subscriber() -> None:
+    """Start the streaming loop (call from lifespan startup). No-op without websockets."""
+    global _pending, _TASK
+    if websockets is None or _TASK is not None:
+        return
+    _pending = asyncio.Queue()
+    _TASK = asyncio.create_task(_subscriber_loop())
+
+
+async def stop_subscriber() -> None:
+    """Stop the streaming loop and drop all windows (call from lifespan shutdown)."""
+    global _pending, _TASK
+    if _TASK is not None:
+        _TASK.cancel()
+        try:
+            await _TASK
+        except asyncio.CancelledError:
+            pass
+        _TASK = None
+    _pending = None
+    _live.clear()
+    _windows.clear()